@@ -0,0 +1,104 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Ahead-of-time compiled kernel for the Equilibrium Statistic Calculator.
+Build with: python setup.py build_ext --inplace
+
+This is a line-for-line port of main._iterate_triplet. Keep the two in step:
+after changing either, bump KERNEL_VERSION here and _KERNEL_VERSION in main.py
+and rebuild. main.py ignores a build whose version does not match.
+"""
+
+import numpy as np
+
+KERNEL_VERSION = 1
+
+# Kernel status codes (must match main.py)
+cdef int _RUNNING = 0
+cdef int _CONVERGED = 1
+cdef int _STAGNATED = 2
+
+
+cdef inline (double, double) _minmax3(double a, double b, double c):
+    """Return the (min, max) of three values in a single pass."""
+    cdef double lo = a if a < b else b
+    cdef double hi = a if a > b else b
+    lo = lo if lo < c else c
+    hi = hi if hi > c else c
+    return lo, hi
+
+
+def iterate_triplet(history_out, Py_ssize_t n, double epsilon, bint stagnation_only):
+    """
+    Apply the mean/median/mode step to a 3-value dataset until it settles.
+
+    Same contract as main._iterate_triplet: iterates from row n - 1 of
+    history_out, appends each new [mean, median, mode] after it (doubling
+    the buffer when full) and stops on convergence or on a repeated triplet.
+
+    Returns:
+        Tuple of (history, rows written, status code, first row of the cycle)
+    """
+    cdef double[:, ::1] h = history_out
+    cdef double a, b, c, lo, mid, hi, mean, median, mode
+    cdef int status = _RUNNING
+    cdef Py_ssize_t cycle_start = -1
+    cdef Py_ssize_t i
+
+    # Row index at which each triplet first appeared
+    seen = {(h[0, 0], h[0, 1], h[0, 2]): 0}
+    for i in range(1, n):
+        key = (h[i, 0], h[i, 1], h[i, 2])
+        if key not in seen:
+            seen[key] = i
+
+    a = h[n - 1, 0]
+    b = h[n - 1, 1]
+    c = h[n - 1, 2]
+
+    while status == _RUNNING:
+        # Sort with compare-swaps so that lo <= mid <= hi
+        lo, mid, hi = a, b, c
+        if lo > mid:
+            lo, mid = mid, lo
+        if mid > hi:
+            mid, hi = hi, mid
+        if lo > mid:
+            lo, mid = mid, lo
+
+        mean = (a + b + c) / 3.0
+        median = mid
+
+        # The mean if all three are unique, otherwise the repeated value
+        if lo != mid and mid != hi:
+            mode = mean
+        elif lo == mid:
+            mode = lo
+        else:
+            mode = mid
+
+        a, b, c = mean, median, mode
+
+        if n == h.shape[0]:
+            grown = np.empty((2 * n, 3), dtype=np.float64)
+            grown[:n] = history_out
+            history_out = grown
+            h = history_out
+        h[n, 0] = a
+        h[n, 1] = b
+        h[n, 2] = c
+        n += 1
+
+        if not stagnation_only:
+            lo, hi = _minmax3(a, b, c)
+            if hi - lo <= epsilon:
+                status = _CONVERGED
+                break
+
+        key = (a, b, c)
+        if key in seen:
+            cycle_start = seen[key]
+            status = _STAGNATED
+        else:
+            seen[key] = n - 1
+
+    return history_out, n, status, cycle_start
@@ -5,66 +5,108 @@ A Python app that recursively calculates mean, median, and mode until convergenc
 """
 
 import statistics
-from collections import Counter
+import warnings
 from typing import List, Tuple, Union
 import matplotlib.pyplot as plt
 import numpy as np
 
+# Version of _iterate_triplet; bump together with KERNEL_VERSION in _core.pyx
+_KERNEL_VERSION = 1
 
-def calculate_mean(data: List[float]) -> float:
+try:
+    # Ahead-of-time compiled kernel, built with: python setup.py build_ext --inplace
+    import _core
+except ImportError:
+    _core = None
+
+if _core is not None and getattr(_core, 'KERNEL_VERSION', None) != _KERNEL_VERSION:
+    warnings.warn("_core is out of date and will be ignored; rebuild it with: python setup.py build_ext --inplace")
+    _core = None
+
+
+def njit(*args, **kwargs):
+    """Stand-in for numba.njit that leaves the function as plain Python."""
+    def decorator(func):
+        return func
+    return decorator
+
+
+# Nothing needs JIT compiling when the compiled kernel is used
+if _core is None:
+    try:
+        from numba import njit
+    except ImportError:
+        # Numba is optional: without it the kernel runs as plain Python
+        pass
+
+
+# Kernel status codes
+_RUNNING = 0
+_CONVERGED = 1
+_STAGNATED = 2
+
+
+def calculate_mean(data: Union[List[float], np.ndarray]) -> float:
     """Calculate the arithmetic mean of a dataset."""
+    if len(data) == 3:
+        return (data[0] + data[1] + data[2]) / 3.0
+    if isinstance(data, np.ndarray):
+        # Builtin sum over boxed np.float64 scalars is slow; sum plain floats instead
+        data = data.tolist()
     return sum(data) / len(data)
 
 
-def calculate_median(data: List[float]) -> float:
+def calculate_median(data: Union[List[float], np.ndarray]) -> float:
     """Calculate the median of a dataset."""
+    if len(data) == 3:
+        # Median of three without sorting
+        a, b, c = data
+        return max(min(a, b), min(max(a, b), c))
+    if isinstance(data, np.ndarray):
+        return float(np.median(data))
     return statistics.median(data)
 
 
-def calculate_mode(data: List[float]) -> float:
+def calculate_mode(data: Union[List[float], np.ndarray]) -> float:
     """
     Calculate the mode of a dataset.
     If multiple modes exist, return the smallest one.
     If no mode exists (all values unique), return the mean.
     """
-    try:
-        # Count frequencies
-        counter = Counter(data)
-        max_count = max(counter.values())
-
-        # If all values appear once, no true mode exists
-        if max_count == 1:
+    # Three values: at most one value can repeat, so compare the pairs directly
+    if len(data) == 3:
+        a, b, c = data
+        if a != b and b != c and a != c:
             return calculate_mean(data)
+        if a == b or a == c:
+            return float(a)
+        return float(b)
 
-        # Find all modes (values with maximum frequency)
-        modes = [value for value, count in counter.items() if count == max_count]
+    arr = np.asarray(data, dtype=np.float64)
 
-        # Return the smallest mode
-        return min(modes)
+    # Count frequencies (np.unique returns the values sorted ascending)
+    values, counts = np.unique(arr, return_counts=True)
+    max_count = counts.max()
 
-    except Exception:
-        # Fallback to mean if mode calculation fails
-        return calculate_mean(data)
+    # If all values appear once, no true mode exists
+    if max_count == 1:
+        return calculate_mean(arr)
 
+    # Return the smallest mode (values with maximum frequency)
+    return float(values[counts == max_count].min())
 
-def check_stagnation(iteration_history: List[List[float]], stagnation_window: int = 1000) -> bool:
-    """
-    Check if the values have been identical for the last N iterations.
-    Returns True if stagnated, False otherwise.
-    """
-    if len(iteration_history) < stagnation_window:
-        return False
 
-    # Get the last N iterations
-    recent_iterations = iteration_history[-stagnation_window:]
+def _minmax3(a, b, c):
+    """Return the (min, max) of three values in a single pass."""
+    lo = a if a < b else b
+    lo = lo if lo < c else c
+    hi = a if a > b else b
+    hi = hi if hi > c else c
+    return lo, hi
 
-    # Check if all iterations in the window are identical
-    first_iteration = recent_iterations[0]
-    for iteration in recent_iterations[1:]:
-        if iteration != first_iteration:
-            return False
 
-    return True
+# Jitted copy for the kernel; Python callers use the plain function above
+_minmax3_jit = njit(cache=True)(_minmax3)
 
 
 def check_convergence(values: List[float], epsilon: float) -> bool:
@@ -75,40 +117,143 @@ def check_convergence(values: List[float], epsilon: float) -> bool:
     if len(values) < 2:
         return True
 
-    min_val = min(values)
-    max_val = max(values)
+    if len(values) == 3:
+        min_val, max_val = _minmax3(values[0], values[1], values[2])
+    else:
+        min_val = min(values)
+        max_val = max(values)
 
     return (max_val - min_val) <= epsilon
 
 
-def calculate_statistics(data: List[float]) -> Tuple[float, float, float]:
+def calculate_statistics(data: Union[List[float], np.ndarray]) -> Tuple[float, float, float]:
     """Calculate mean, median, and mode for a dataset."""
-    mean = calculate_mean(data)
-    median = calculate_median(data)
-    mode = calculate_mode(data)
+    # Convert once: the mean sums plain floats, median and mode work on the array
+    arr = np.asarray(data, dtype=np.float64)
+    values = arr.tolist()
+
+    mean = float(calculate_mean(values))
+    median = float(calculate_median(arr))
+    mode = float(calculate_mode(arr))
 
     return mean, median, mode
 
 
-def format_values(values: List[float], precision: int = 6) -> str:
+def format_values(values: Union[List[float], np.ndarray], precision: int = 6) -> List[float]:
     """Format values for display with consistent precision."""
-    return [round(v, precision) for v in values]
+    return np.round(np.asarray(values, dtype=np.float64), precision).tolist()
 
 
-def equilibrium_statistic(initial_data: List[float], epsilon: Union[float, str] = 0.001, show_graph: bool = False) -> \
-Tuple[float, List[List[float]]]:
+@njit(cache=True)
+def _iterate_triplet(history_out, n, epsilon, stagnation_only):
+    """
+    Apply the mean/median/mode step to a 3-value dataset until it settles.
+
+    Iterates from row n - 1 of history_out and appends each new
+    [mean, median, mode] after it, doubling the buffer when full.
+    The step is deterministic, so a triplet that was already seen means the
+    values are stuck in a cycle (a fixed point is a cycle of length one).
+
+    Returns:
+        Tuple of (history, rows written, status code, first row of the cycle)
+    """
+    status = _RUNNING
+    cycle_start = -1
+
+    # Row index at which each triplet first appeared
+    seen = {(history_out[0, 0], history_out[0, 1], history_out[0, 2]): 0}
+    for i in range(1, n):
+        key = (history_out[i, 0], history_out[i, 1], history_out[i, 2])
+        if key not in seen:
+            seen[key] = i
+
+    a = history_out[n - 1, 0]
+    b = history_out[n - 1, 1]
+    c = history_out[n - 1, 2]
+
+    while status == _RUNNING:
+        # Sort with compare-swaps so that lo <= mid <= hi
+        lo, mid, hi = a, b, c
+        if lo > mid:
+            lo, mid = mid, lo
+        if mid > hi:
+            mid, hi = hi, mid
+        if lo > mid:
+            lo, mid = mid, lo
+
+        mean = (a + b + c) / 3.0
+        median = mid
+
+        # The mean if all three are unique, otherwise the repeated value
+        if lo != mid and mid != hi:
+            mode = mean
+        elif lo == mid:
+            mode = lo
+        else:
+            mode = mid
+
+        a, b, c = mean, median, mode
+
+        if n == history_out.shape[0]:
+            grown = np.empty((2 * n, 3), dtype=np.float64)
+            grown[:n] = history_out
+            history_out = grown
+        history_out[n, 0] = a
+        history_out[n, 1] = b
+        history_out[n, 2] = c
+        n += 1
+
+        if not stagnation_only:
+            lo, hi = _minmax3_jit(a, b, c)
+            if hi - lo <= epsilon:
+                status = _CONVERGED
+                break
+
+        key = (a, b, c)
+        if key in seen:
+            cycle_start = seen[key]
+            status = _STAGNATED
+        else:
+            seen[key] = n - 1
+
+    return history_out, n, status, cycle_start
+
+
+if _core is not None:
+    _iterate_triplet = _core.iterate_triplet
+
+
+def display_iteration(iteration: int, input_values: List[float], output_values: List[float]):
+    """Print the input and resulting statistics of one iteration."""
+    mean, median, mode = output_values
+    print(f"Iteration {iteration}:")
+    print(f"  Input:  {format_values(input_values)}")
+    print(f"  Mean:   {round(mean, 6)}")
+    print(f"  Median: {round(median, 6)}")
+    print(f"  Mode:   {round(mode, 6)}")
+    print(f"  Output: {format_values(output_values)}")
+
+
+def equilibrium_statistic(initial_data: Union[List[float], np.ndarray], epsilon: Union[float, str] = 0.001,
+                          show_graph: bool = False, verbose: bool = False,
+                          log_every: int = 0) -> Tuple[float, np.ndarray]:
     """
     Calculate the equilibrium statistic by recursively applying mean, median, mode
     until convergence within epsilon or stagnation.
 
+    The first iteration runs on the full dataset; every later iteration works on
+    exactly three values and is handed to the compiled _iterate_triplet kernel.
+
     Args:
         initial_data: Initial dataset
         epsilon: Convergence threshold (float) or '*' for stagnation-only mode
         show_graph: Whether to return data for graphing
+        verbose: Whether to print the details of each iteration
+        log_every: When verbose, print only every N-th iteration (0 prints all)
 
     Returns:
         Tuple of (converged_value, iteration_history) where iteration_history
-        contains [mean, median, mode] for each iteration
+        is an (iterations, 3) array of [mean, median, mode] rows
     """
 
     stagnation_only = (epsilon == '*')
@@ -116,146 +261,174 @@ Tuple[float, List[List[float]]]:
     print(f"🧮 Starting Equilibrium Statistic Calculation")
     print(f"📊 Initial Dataset: {format_values(initial_data)}")
     if stagnation_only:
-        print(f"🎯 Mode: Stagnation-only (run until 1000 identical iterations)")
+        print(f"🎯 Mode: Stagnation-only (run until the values repeat)")
     else:
         print(f"🎯 Convergence Threshold (ε): {epsilon}")
     print("-" * 60)
 
-    current_data = initial_data.copy()
-    iteration = 0
-    iteration_history = []
-
-    while True:  # Run until convergence
-        # Calculate statistics
-        mean, median, mode = calculate_statistics(current_data)
-        new_data = [mean, median, mode]
-
-        # Store for graphing
-        iteration_history.append([mean, median, mode])
-
-        iteration += 1
-
-        # Display current iteration
-        print(f"Iteration {iteration}:")
-        print(f"  Input:  {format_values(current_data)}")
-        print(f"  Mean:   {round(mean, 6)}")
-        print(f"  Median: {round(median, 6)}")
-        print(f"  Mode:   {round(mode, 6)}")
-        print(f"  Output: {format_values(new_data)}")
-
-        # Check for convergence (only if not in stagnation-only mode)
-        if not stagnation_only and check_convergence(new_data, epsilon):
-            equilibrium_stat = sum(new_data) / len(new_data)  # Average of converged values
-            print("-" * 60)
-            print(f"✅ CONVERGENCE ACHIEVED after {iteration} iterations!")
-            print(f"🎯 Equilibrium Statistic: {round(equilibrium_stat, 6)}")
-            return equilibrium_stat, iteration_history
-
-        # Check for stagnation (always check, but behavior depends on mode)
-        if check_stagnation(iteration_history):
-            equilibrium_stat = sum(new_data) / len(new_data)  # Average of stagnated values
-
-            # Remove last 999 iterations from history for cleaner graphing
-            if len(iteration_history) >= 1000:
-                iteration_history = iteration_history[:-999]
-
-            print("-" * 60)
-            if stagnation_only:
-                print(f"🔄 STAGNATION ACHIEVED after {iteration} iterations!")
-                print(f"   Values have been identical for the last 1000 iterations.")
-            else:
-                print(f"🔄 STAGNATION DETECTED after {iteration} iterations!")
-                print(f"   Values have been identical for the last 1000 iterations.")
-            print(f"🎯 Equilibrium Statistic: {round(equilibrium_stat, 6)}")
-            return equilibrium_stat, iteration_history
+    # The input is only read, never modified, so no copy is needed
+    current_data = initial_data
 
-        # Show progress info
-        if stagnation_only:
-            print(f"  Status: Running until stagnation...")
-        else:
-            spread = max(new_data) - min(new_data)
-            print(f"  Spread: {round(spread, 6)} (target: ≤ {epsilon})")
-        print()
+    # First iteration on the full dataset, written straight into the history buffer
+    history = np.empty((1024, 3), dtype=np.float64)
+    history[0] = calculate_statistics(current_data)
+    n = 1
+
+    if not stagnation_only and check_convergence(history[0], epsilon):
+        status = _CONVERGED
+    elif len(current_data) == 3 and np.array_equal(history[0], current_data):
+        # A 3-value input that maps to itself is already a fixed point
+        status = _STAGNATED
+        cycle_start = 0
+    else:
+        status = _RUNNING
+
+    # Remaining iterations on the [mean, median, mode] triplet
+    if status == _RUNNING:
+        kernel_epsilon = 0.0 if stagnation_only else float(epsilon)
+        history, n, status, cycle_start = _iterate_triplet(history, n, kernel_epsilon, stagnation_only)
+    iteration_history = history[:n]
+
+    iteration = len(iteration_history)
+
+    # Display iterations
+    if verbose:
+        for i, new_data in enumerate(iteration_history, start=1):
+            if log_every == 0 or i % log_every == 0:
+                display_iteration(i, current_data, new_data)
+
+                if i < iteration:
+                    # Show progress info
+                    if stagnation_only:
+                        print(f"  Status: Running until stagnation...")
+                    else:
+                        lo, hi = _minmax3(new_data[0], new_data[1], new_data[2])
+                        spread = hi - lo
+                        print(f"  Spread: {round(spread, 6)} (target: ≤ {epsilon})")
+                    print()
+
+            current_data = new_data
+
+    equilibrium_stat = float(iteration_history[-1].mean())  # Average of converged values
+
+    if status == _CONVERGED:
+        print("-" * 60)
+        print(f"✅ CONVERGENCE ACHIEVED after {iteration} iterations!")
+        print(f"🎯 Equilibrium Statistic: {round(equilibrium_stat, 6)}")
+        return equilibrium_stat, iteration_history
+
+    # Drop the repeated row so the graph shows each cycle value once
+    if cycle_start < len(iteration_history) - 1:
+        iteration_history = iteration_history[:-1]
+
+    # Average over the whole cycle (a single row for a fixed point)
+    cycle = iteration_history[cycle_start:]
+    cycle_length = len(cycle)
+    equilibrium_stat = float(cycle.mean())
 
-        # Update data for next iteration
-        current_data = new_data
+    print("-" * 60)
+    if stagnation_only:
+        print(f"🔄 STAGNATION ACHIEVED after {iteration} iterations!")
+    else:
+        print(f"🔄 STAGNATION DETECTED after {iteration} iterations!")
+    if cycle_length == 1:
+        print(f"   Values have stopped changing.")
+    else:
+        print(f"   Values repeat in a cycle of {cycle_length} iterations.")
+    print(f"🎯 Equilibrium Statistic: {round(equilibrium_stat, 6)}")
+    return equilibrium_stat, iteration_history
 
 
-def plot_convergence(iteration_history: List[List[float]], epsilon: Union[float, str], final_value: float):
+def plot_convergence(iteration_history: np.ndarray, epsilon: Union[float, str], final_value: float):
     """
     Plot the convergence of mean, median, and mode over iterations.
 
     Args:
-        iteration_history: List of [mean, median, mode] for each iteration
+        iteration_history: (iterations, 3) array of [mean, median, mode] rows
         epsilon: Convergence threshold (float) or '*' for stagnation-only mode
         final_value: Final converged value
     """
-    if not iteration_history:
+    iteration_history = np.asarray(iteration_history, dtype=np.float64)
+    if len(iteration_history) == 0:
         print("❌ No data to plot.")
         return
 
     stagnation_only = (epsilon == '*')
 
-    # Convert to arrays for easier plotting
-    iterations = range(1, len(iteration_history) + 1)
-    means = [stats[0] for stats in iteration_history]
-    medians = [stats[1] for stats in iteration_history]
-    modes = [stats[2] for stats in iteration_history]
-
-    # Create the plot
-    plt.figure(figsize=(12, 8))
-
-    # Plot the three statistics
-    plt.plot(iterations, means, 'b-o', label='Mean', linewidth=2, markersize=6)
-    plt.plot(iterations, medians, 'r-s', label='Median', linewidth=2, markersize=6)
-    plt.plot(iterations, modes, 'g-^', label='Mode', linewidth=2, markersize=6)
-
-    # Add convergence zone (only if not in stagnation-only mode)
-    if len(iteration_history) > 1 and not stagnation_only:
-        plt.axhline(y=final_value + epsilon / 2, color='orange', linestyle='--', alpha=0.7, label=f'±ε/2 zone')
-        plt.axhline(y=final_value - epsilon / 2, color='orange', linestyle='--', alpha=0.7)
-        plt.fill_between(iterations, final_value - epsilon / 2, final_value + epsilon / 2,
-                         color='yellow', alpha=0.2, label='Convergence Zone')
-
-    # Add final convergence line
-    plt.axhline(y=final_value, color='black', linestyle='-', linewidth=2, alpha=0.8,
-                label=f'Equilibrium Statistic: {final_value:.6f}')
-
-    # Styling
-    plt.xlabel('Iteration', fontsize=12, fontweight='bold')
-    plt.ylabel('Value', fontsize=12, fontweight='bold')
-
-    if stagnation_only:
-        plt.title('Equilibrium Statistic Convergence (Stagnation Mode)', fontsize=16, fontweight='bold')
+    # Decimate long runs to at most 500 evenly spaced points, keeping the first and last exactly
+    total = len(iteration_history)
+    if total > 500:
+        idx = np.linspace(0, total - 1, 500).astype(int)
     else:
-        plt.title('Equilibrium Statistic Convergence', fontsize=16, fontweight='bold')
+        idx = np.arange(total)
+
+    # Columns of the history array
+    iterations = idx + 1
+    means = iteration_history[idx, 0]
+    medians = iteration_history[idx, 1]
+    modes = iteration_history[idx, 2]
+
+    # Build the figure with interactive mode off so nothing redraws until plt.show();
+    # the previous mode is restored even if plotting fails
+    with plt.ioff():
+        # Create the plot
+        fig, ax = plt.subplots(figsize=(12, 8))
+
+        # Plot the three statistics as plain lines
+        ax.plot(iterations, means, 'b-', label='Mean', linewidth=2)
+        ax.plot(iterations, medians, 'r-', label='Median', linewidth=2)
+        ax.plot(iterations, modes, 'g-', label='Mode', linewidth=2)
+
+        # Mark individual iterations only while there are few of them
+        if len(iterations) <= 50:
+            ax.plot(iterations, means, 'bo', markersize=6)
+            ax.plot(iterations, medians, 'rs', markersize=6)
+            ax.plot(iterations, modes, 'g^', markersize=6)
+
+        # Add convergence zone (only if not in stagnation-only mode)
+        if len(iteration_history) > 1 and not stagnation_only:
+            ax.axhspan(final_value - epsilon / 2, final_value + epsilon / 2, color='yellow', alpha=0.2,
+                       label='Convergence Zone (±ε/2)')
+
+        # Add final convergence line
+        ax.axhline(y=final_value, color='black', linestyle='-', linewidth=2, alpha=0.8,
+                   label=f'Equilibrium Statistic: {final_value:.6f}')
+
+        # Styling
+        ax.set_xlabel('Iteration', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Value', fontsize=12, fontweight='bold')
+
+        if stagnation_only:
+            ax.set_title('Equilibrium Statistic Convergence (Stagnation Mode)', fontsize=16, fontweight='bold')
+        else:
+            ax.set_title('Equilibrium Statistic Convergence', fontsize=16, fontweight='bold')
 
-    plt.grid(True, alpha=0.3)
-    plt.legend(loc='best', frameon=True, fancybox=True, shadow=True)
+        ax.grid(True, alpha=0.3)
+        ax.legend(loc='best', frameon=True, fancybox=True, shadow=True)
 
-    # Set reasonable axis limits
-    all_values = means + medians + modes
-    y_min, y_max = min(all_values), max(all_values)
-    y_range = y_max - y_min
-    if y_range > 0:
-        plt.ylim(y_min - 0.1 * y_range, y_max + 0.1 * y_range)
+        # Set reasonable axis limits
+        y_min, y_max = iteration_history.min(), iteration_history.max()
+        y_range = y_max - y_min
+        if y_range > 0:
+            ax.set_ylim(y_min - 0.1 * y_range, y_max + 0.1 * y_range)
 
-    plt.tight_layout()
+        fig.tight_layout()
 
-    # Show plot
-    plt.show()
+        # Show plot
+        plt.show()
 
     # Print summary statistics
     print("\n📈 Convergence Analysis:")
     print(f"   • Total iterations: {len(iteration_history)}")
-    print(f"   • Initial spread: {max(iteration_history[0]) - min(iteration_history[0]):.6f}")
-    print(f"   • Final spread: {max(iteration_history[-1]) - min(iteration_history[-1]):.6f}")
-    print(
-        f"   • Convergence rate: {((max(iteration_history[0]) - min(iteration_history[0])) / max(1e-10, max(iteration_history[-1]) - min(iteration_history[-1]))):.2f}x reduction")
+    initial_spread = np.ptp(iteration_history[0])
+    final_spread = np.ptp(iteration_history[-1])
+    print(f"   • Initial spread: {initial_spread:.6f}")
+    print(f"   • Final spread: {final_spread:.6f}")
+    print(f"   • Convergence rate: {initial_spread / max(1e-10, final_spread):.2f}x reduction")
 
 
-def get_user_input() -> Tuple[List[float], Union[float, str], bool]:
-    """Get dataset, epsilon (or '*' for stagnation-only), and graph preference from user input."""
+def get_user_input() -> Tuple[np.ndarray, Union[float, str], bool, bool]:
+    """Get dataset, epsilon (or '*' for stagnation-only), graph and verbosity preferences from user input."""
 
     print("🧑‍💻 Equilibrium Statistic Calculator")
     print("=" * 50)
@@ -264,7 +437,7 @@ def get_user_input() -> Tuple[List[float], Union[float, str], bool]:
     while True:
         try:
             data_input = input("📥 Enter numbers separated by commas: ").strip()
-            data = [float(x.strip()) for x in data_input.split(',') if x.strip()]
+            data = np.fromiter((float(x) for x in data_input.split(',') if x.strip()), dtype=np.float64)
 
             if len(data) < 1:
                 print("❌ Please enter at least one number.")
@@ -309,19 +482,32 @@ def get_user_input() -> Tuple[List[float], Union[float, str], bool]:
         else:
             print("❌ Please enter 'y' for yes or 'n' for no (default is yes).")
 
-    return data, epsilon, show_graph
+    # Get verbosity preference
+    while True:
+        verbose_input = input("🔍 Do you want to see every iteration? (Y/n): ").strip().lower()
+
+        if verbose_input in ['', 'y', 'yes', '1', 'true']:  # Default to yes (empty input = yes)
+            verbose = True
+            break
+        elif verbose_input in ['n', 'no', '0', 'false']:
+            verbose = False
+            break
+        else:
+            print("❌ Please enter 'y' for yes or 'n' for no (default is yes).")
+
+    return data, epsilon, show_graph, verbose
 
 
 def main():
     """Main application entry point."""
     try:
         # Get user input
-        data, epsilon, show_graph = get_user_input()
+        data, epsilon, show_graph, verbose = get_user_input()
 
         print("\n" + "=" * 60)
 
         # Calculate equilibrium statistic
-        result, history = equilibrium_statistic(data, epsilon, show_graph=show_graph)
+        result, history = equilibrium_statistic(data, epsilon, show_graph=show_graph, verbose=verbose)
 
         print("=" * 60)
         print(f"🏆 FINAL RESULT: The Equilibrium Statistic is {round(result, 6)}")
@@ -0,0 +1,13 @@
+"""
+Build the optional ahead-of-time compiled kernel:
+
+    python setup.py build_ext --inplace
+"""
+
+from Cython.Build import cythonize
+from setuptools import setup
+
+setup(
+    name="equilibrium-statistic",
+    ext_modules=cythonize("_core.pyx"),
+)